@@ -59,6 +59,8 @@ async def async_setup_entry(
     # Test to see if api initialised correctly, else raise ConfigNotReady to make HA retry setup
     # Change this to match how your api will know if connected or successful update
     if not coordinator.api.data["comm_sernum"]:
+        # a retry builds a new client, don't leave this session open on the inverter
+        await coordinator.api.async_close()
         raise ConfigEntryNotReady(
             f"Timeout connecting to {config_entry.data.get(CONF_NAME)}"
         )
@@ -75,11 +77,16 @@ async def async_setup_entry(
     # Note: this will change on HA2024.6 to save on the config entry.
     config_entry.runtime_data = RuntimeData(coordinator, update_listener)
 
-    # Setup platforms
-    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+    try:
+        # Setup platforms
+        await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
-    # Regiser device
-    await async_update_device_registry(hass, config_entry)
+        # Regiser device
+        await async_update_device_registry(hass, config_entry)
+    except Exception:
+        # setup failed after the first refresh opened the Modbus TCP session
+        await coordinator.api.async_close()
+        raise
 
     # Return true to denote a successful setup.
     return True
@@ -135,7 +142,7 @@ async def async_unload_entry(
             # coordinator = getattr(config_entry.runtime_data, 'coordinator', None)
             coordinator = config_entry.runtime_data.coordinator
             if coordinator.api:
-                coordinator.api.close()
+                await coordinator.api.async_close()
                 _LOGGER.debug("Closed API connection")
 
             # Remove update listener if exists
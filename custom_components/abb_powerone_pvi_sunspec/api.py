@@ -3,28 +3,101 @@
 https://github.com/alexdelprete/ha-abb-powerone-pvi-sunspec
 """
 
+import array
+import asyncio
 import logging
 import socket
-import threading
+import struct
+import sys
+import time
 
 from homeassistant.core import HomeAssistant
 from pymodbus import ExceptionResponse
-from pymodbus.client import ModbusTcpClient
-from pymodbus.constants import Endian
+from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ConnectionException, ModbusException
-from pymodbus.payload import BinaryPayloadDecoder
 
 from .const import (
     DEVICE_GLOBAL_STATUS,
     DEVICE_MODEL,
     DEVICE_STATUS,
     INVERTER_TYPE,
+    MAX_RETRY_BACKOFF,
+    SUNSPEC_M101_103_REGS,
+    SUNSPEC_M101_REGS,
+    SUNSPEC_M103_REGS,
+    SUNSPEC_M160_MODULE_1_REGS,
+    SUNSPEC_M160_MODULE_2_REGS,
     SUNSPEC_M160_OFFSETS,
     SUNSPEC_MODEL_160_ID,
+    TCP_KEEPALIVE_COUNT,
+    TCP_KEEPALIVE_IDLE,
+    TCP_KEEPALIVE_INTERVAL,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Powers of ten for the SunSpec scale factor range (-10..10)
+_POW10 = {sf: 10**sf for sf in range(-10, 11)}
+
+
+# Precompiled big-endian layouts of the realtime sweeps (unsigned and signed)
+_M101_103_LAYOUT = struct.Struct(">40H")
+_M101_103_SIGNED_LAYOUT = struct.Struct(">40h")
+_M160_LAYOUT = struct.Struct(">42H")
+_M160_SIGNED_LAYOUT = struct.Struct(">42h")
+# Manufacturer, model, options, version and serial strings of the M1 sweep
+_M1_STRINGS_LAYOUT = struct.Struct("32s32s16s16s32s")
+
+# Initial ModBus data structure, copied into each client before the first read
+_DATA_TEMPLATE = {
+    "accurrent": 1,
+    "accurrenta": 1,
+    "accurrentb": 1,
+    "accurrentc": 1,
+    "acvoltageab": 1,
+    "acvoltagebc": 1,
+    "acvoltageca": 1,
+    "acvoltagean": 1,
+    "acvoltagebn": 1,
+    "acvoltagecn": 1,
+    "acpower": 1,
+    "acfreq": 1,
+    "comm_options": 1,
+    "comm_manufact": "",
+    "comm_model": "",
+    "comm_version": "",
+    "comm_sernum": "",
+    "mppt_nr": 1,
+    "dccurr": 1,
+    "dcvolt": 1,
+    "dcpower": 1,
+    "dc1curr": 1,
+    "dc1volt": 1,
+    "dc1power": 1,
+    "dc2curr": 1,
+    "dc2volt": 1,
+    "dc2power": 1,
+    "invtype": "",
+    "status": "",
+    "statusvendor": "",
+    "totalenergy": 1,
+    "tempcab": 1,
+    "tempoth": 1,
+}
+
+
+def _registers_to_bytes(regs) -> bytes:
+    """Return the big-endian byte payload of a list of 16-bit registers.
+
+    Only used for the one-shot M1 string decode, the realtime sweeps are packed
+    with their precompiled layouts.
+
+    """
+    payload = array.array("H", regs)
+    if sys.byteorder == "little":
+        payload.byteswap()
+    return payload.tobytes()
+
 
 class ConnectionError(Exception):
     """Empty Error Class."""
@@ -45,7 +118,7 @@ class ExceptionError(Exception):
 
 
 class ABBPowerOneFimerAPI:
-    """Thread safe wrapper class for pymodbus."""
+    """Async wrapper class for pymodbus."""
 
     def __init__(
         self,
@@ -79,46 +152,29 @@ class ABBPowerOneFimerAPI:
         # Ensure ModBus Timeout is 1s less than scan_interval
         # https://github.com/binsentsu/home-assistant-solaredge-modbus/pull/183
         self._timeout = self._update_interval - 1
-        self._client = ModbusTcpClient(
-            host=self._host, port=self._port, timeout=self._timeout
+        # reconnect_delay=0 disables the library's background reconnects: connect()
+        # must be the only place a session is opened, so that keepalive is set on
+        # every socket and no second session competes for the inverter's slots
+        self._client = AsyncModbusTcpClient(
+            host=self._host,
+            port=self._port,
+            timeout=self._timeout,
+            reconnect_delay=0,
+            on_connect_callback=self._on_connection_change,
         )
-        self._lock = threading.Lock()
-        self._sensors = []
-        self.data = {}
+        self._lock = asyncio.Lock()
+        # consecutive failed polls and monotonic time of the next allowed attempt
+        self._fail_count = 0
+        self._next_attempt = 0.0
+        # M1 must be (re)read on the next poll, set on every new connection
+        self._m1_pending = True
+        # SunSpec Model 160 offset, cached once found (0 until then)
+        self._m160_offset = 0
+        # Reusable byte buffers of the realtime sweeps, guarded by self._lock
+        self._m101_103_buf = bytearray(_M101_103_LAYOUT.size)
+        self._m160_buf = bytearray(_M160_LAYOUT.size)
         # Initialize ModBus data structure before first read
-        self.data["accurrent"] = 1
-        self.data["accurrenta"] = 1
-        self.data["accurrentb"] = 1
-        self.data["accurrentc"] = 1
-        self.data["acvoltageab"] = 1
-        self.data["acvoltagebc"] = 1
-        self.data["acvoltageca"] = 1
-        self.data["acvoltagean"] = 1
-        self.data["acvoltagebn"] = 1
-        self.data["acvoltagecn"] = 1
-        self.data["acpower"] = 1
-        self.data["acfreq"] = 1
-        self.data["comm_options"] = 1
-        self.data["comm_manufact"] = ""
-        self.data["comm_model"] = ""
-        self.data["comm_version"] = ""
-        self.data["comm_sernum"] = ""
-        self.data["mppt_nr"] = 1
-        self.data["dccurr"] = 1
-        self.data["dcvolt"] = 1
-        self.data["dcpower"] = 1
-        self.data["dc1curr"] = 1
-        self.data["dc1volt"] = 1
-        self.data["dc1power"] = 1
-        self.data["dc2curr"] = 1
-        self.data["dc2volt"] = 1
-        self.data["dc2power"] = 1
-        self.data["invtype"] = ""
-        self.data["status"] = ""
-        self.data["statusvendor"] = ""
-        self.data["totalenergy"] = 1
-        self.data["tempcab"] = 1
-        self.data["tempoth"] = 1
+        self.data = dict(_DATA_TEMPLATE)
 
     @property
     def name(self):
@@ -132,57 +188,64 @@ class ABBPowerOneFimerAPI:
 
     def check_port(self) -> bool:
         """Check if port is available."""
-        with self._lock:
-            sock_timeout = float(3)
+        sock_timeout = float(3)
+        _LOGGER.debug(
+            f"Check_Port: opening socket on {self._host}:{self._port} with a {sock_timeout}s timeout."
+        )
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # per-socket timeout: the process-wide default is shared with HA core
+        sock.settimeout(sock_timeout)
+        sock_res = sock.connect_ex((self._host, self._port))
+        is_open = sock_res == 0  # True if open, False if not
+        if is_open:
+            sock.shutdown(socket.SHUT_RDWR)
             _LOGGER.debug(
-                f"Check_Port: opening socket on {self._host}:{self._port} with a {sock_timeout}s timeout."
+                f"Check_Port (SUCCESS): port open on {self._host}:{self._port}"
             )
-            socket.setdefaulttimeout(sock_timeout)
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock_res = sock.connect_ex((self._host, self._port))
-            is_open = sock_res == 0  # True if open, False if not
-            if is_open:
-                sock.shutdown(socket.SHUT_RDWR)
-                _LOGGER.debug(
-                    f"Check_Port (SUCCESS): port open on {self._host}:{self._port}"
-                )
-            else:
-                _LOGGER.debug(
-                    f"Check_Port (ERROR): port not available on {self._host}:{self._port} - error: {sock_res}"
-                )
-            sock.close()
+        else:
+            _LOGGER.debug(
+                f"Check_Port (ERROR): port not available on {self._host}:{self._port} - error: {sock_res}"
+            )
+        sock.close()
         return is_open
 
     def close(self):
         """Disconnect client."""
         try:
-            if self._client.is_socket_open():
+            if self._client.connected:
                 _LOGGER.debug("Closing Modbus TCP connection")
-                with self._lock:
-                    self._client.close()
-                    return True
+                self._client.close()
+                return True
             else:
                 _LOGGER.debug("Modbus TCP connection already closed")
         except ConnectionException as connect_error:
             _LOGGER.debug(f"Close Connection connect_error: {connect_error}")
             raise ConnectionError() from connect_error
 
-    def connect(self):
+    async def async_close(self):
+        """Disconnect client once any running poll cycle is completed."""
+        async with self._lock:
+            return self.close()
+
+    async def connect(self):
         """Connect client."""
         _LOGGER.debug(
             f"API Client connect to IP: {self._host} port: {self._port} slave id: {self._slave_id} timeout: {self._timeout}"
         )
-        if self.check_port():
+        # check_port uses a blocking socket, run it in the executor
+        if await self._hass.async_add_executor_job(self.check_port):
             _LOGGER.debug("Inverter ready for Modbus TCP connection")
             try:
-                with self._lock:
-                    self._client.connect()
+                await self._client.connect()
                 if not self._client.connected:
                     raise ConnectionError(
                         f"Failed to connect to {self._host}:{self._port} slave id {self._slave_id} timeout: {self._timeout}"
                     )
                 else:
                     _LOGGER.debug("Modbus TCP Client connected")
+                    self.set_keepalive()
+                    # firmware updates reboot the inverter: refresh M1 after reconnects
+                    self._m1_pending = True
                     return True
             except ModbusException:
                 raise ConnectionError(
@@ -192,14 +255,44 @@ class ABBPowerOneFimerAPI:
             _LOGGER.debug("Inverter not ready for Modbus TCP connection")
             raise ConnectionError(f"Inverter not active on {self._host}:{self._port}")
 
-    def read_holding_registers(self, address, count):
+    def _on_connection_change(self, connected: bool) -> None:
+        """Flag M1 for a re-read when the session drops, the inverter may reboot."""
+        if not connected:
+            self._m1_pending = True
+
+    def set_keepalive(self):
+        """Enable TCP keepalive so the connection persists across polls."""
+        transport = getattr(getattr(self._client, "ctx", None), "transport", None)
+        sock = transport.get_extra_info("socket") if transport else None
+        if sock is None:
+            _LOGGER.debug("TCP keepalive not set: socket not available")
+            return
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # keepalive tuning options are not available on every platform
+            for option, value in (
+                ("TCP_KEEPIDLE", TCP_KEEPALIVE_IDLE),
+                ("TCP_KEEPINTVL", TCP_KEEPALIVE_INTERVAL),
+                ("TCP_KEEPCNT", TCP_KEEPALIVE_COUNT),
+            ):
+                if hasattr(socket, option):
+                    sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+        except OSError as os_error:
+            _LOGGER.debug(f"TCP keepalive not set: {os_error}")
+            return
+        _LOGGER.debug("TCP keepalive enabled on Modbus TCP connection")
+
+    async def read_holding_registers(self, address, count):
         """Read holding registers."""
 
+        # recover a connection dropped since the last read
+        if not self._client.connected:
+            _LOGGER.debug("Modbus TCP connection lost, reconnecting")
+            await self.connect()
         try:
-            with self._lock:
-                return self._client.read_holding_registers(
-                    address=address, count=count, slave=self._slave_id
-                )
+            return await self._client.read_holding_registers(
+                address=address, count=count, slave=self._slave_id
+            )
         except ConnectionException as connect_error:
             _LOGGER.debug(f"Read Holding Registers connect_error: {connect_error}")
             raise ConnectionError() from connect_error
@@ -209,68 +302,102 @@ class ABBPowerOneFimerAPI:
 
     def calculate_value(self, value, scalefactor):
         """Apply Scale Factor."""
-        return value * 10**scalefactor
+        return value * (_POW10.get(scalefactor) or 10**scalefactor)
+
+    def scale_registers(self, regs, sregs, reg_map):
+        """Apply Scale Factors to the registers described by reg_map.
+
+        Args:
+            regs: Register values of a single read
+            sregs: The same register values reinterpreted as signed
+            reg_map: Tuples of (data key, value offset, signed, sf offset)
+
+        """
+        for key, offset, signed, sf_offset in reg_map:
+            value = sregs[offset] if signed else regs[offset]
+            scalefactor = sregs[sf_offset]
+            self.data[key] = round(
+                value * (_POW10.get(scalefactor) or 10**scalefactor), -scalefactor
+            )
+
+    def backoff(self):
+        """Delay the next poll attempt exponentially after a failure."""
+        self._fail_count += 1
+        delay = min(2**self._fail_count, MAX_RETRY_BACKOFF)
+        self._next_attempt = time.monotonic() + delay
+        _LOGGER.debug(
+            f"Poll failed {self._fail_count} times, next attempt in {delay}s"
+        )
+
+    async def async_get_sernum(self) -> str:
+        """Read only the M1 common block and return the serial number.
+
+        Used to identify the device when no realtime data is needed.
+
+        """
+        async with self._lock:
+            try:
+                if await self.connect():
+                    await self.read_sunspec_modbus_model_1()
+                    return self.data["comm_sernum"]
+                return ""
+            finally:
+                self.close()
 
     async def async_get_data(self):
         """Read Data Function."""
-
-        try:
-            if self.connect():
-                _LOGGER.debug(
-                    f"Start Get data (Slave ID: {self._slave_id} - Base Address: {self._base_addr})"
-                )
-                # HA way to call a sync function from async function
-                # https://developers.home-assistant.io/docs/asyncio_working_with_async?#calling-sync-functions-from-async
-                result = await self._hass.async_add_executor_job(
-                    self.read_sunspec_modbus
+        # serialize poll cycles with close(), they share the persistent connection
+        async with self._lock:
+            # skip the whole TCP cycle while backing off after failed polls
+            if (now := time.monotonic()) < self._next_attempt:
+                raise ConnectionError(
+                    f"Skipping poll after {self._fail_count} failures, retry in {self._next_attempt - now:.0f}s"
                 )
-                self.close()
-                _LOGGER.debug("End Get data")
-                if result:
+            try:
+                # keep the connection open across polls, (re)connect only when needed
+                if self._client.connected or await self.connect():
+                    _LOGGER.debug(
+                        f"Start Get data (Slave ID: {self._slave_id} - Base Address: {self._base_addr})"
+                    )
+                    # M1 (Common Inverter Info) only changes with a firmware update,
+                    # which reboots the inverter: read it once per connection
+                    if self._m1_pending:
+                        await self.read_sunspec_modbus_model_1()
+                        self._m1_pending = False
+                    await self.read_sunspec_modbus_model_101_103()
+                    # Find SunSpec Model 160 Offset until found, it doesn't change at runtime
+                    # a failed probe returns 0 too, so "not found" is never cached
+                    if not self._m160_offset:
+                        self._m160_offset = await self.find_sunspec_modbus_m160_offset()
+                    # Read Model 160 data only if found
+                    if self._m160_offset:
+                        await self.read_sunspec_modbus_model_160(self._m160_offset)
+                    _LOGGER.debug("End Get data")
                     _LOGGER.debug("Get Data Result: valid")
+                    self._fail_count = 0
+                    self._next_attempt = 0.0
                     return True
                 else:
-                    _LOGGER.debug("Get Data Result: invalid")
+                    _LOGGER.debug("Get Data failed: client not connected")
                     return False
-            else:
-                _LOGGER.debug("Get Data failed: client not connected")
-                return False
-        except ConnectionException as connect_error:
-            _LOGGER.debug(f"Async Get Data connect_error: {connect_error}")
-            raise ConnectionError() from connect_error
-        except ModbusException as modbus_error:
-            _LOGGER.debug(f"Async Get Data modbus_error: {modbus_error}")
-            raise ModbusError() from modbus_error
-
-    def read_sunspec_modbus(self) -> bool:
-        """Read Modbus Data Function."""
-        try:
-            self.read_sunspec_modbus_model_1()
-            self.read_sunspec_modbus_model_101_103()
-            # Find SunSpec Model 160 Offset and read data only if found
-            if offset := self.find_sunspec_modbus_m160_offset():
-                self.read_sunspec_modbus_model_160(offset)
-            result = True
-            _LOGGER.debug(f"read_sunspec_modbus: success {result}")
-        except ModbusException as modbus_error:
-            _LOGGER.debug(
-                f"(read_sunspec_modbus) Find M160 modbus_error: {modbus_error}"
-            )
-            result = False
-            raise ModbusError() from modbus_error
-        except ConnectionException as connect_error:
-            _LOGGER.debug(
-                f"(read_sunspec_modbus) Connection connect_error: {connect_error}"
-            )
-            result = False
-            raise ConnectionError() from connect_error
-        except Exception as exception_error:
-            _LOGGER.debug(f"(read_sunspec_modbus) Generic error: {exception_error}")
-            result = False
-            raise ExceptionError() from exception_error
-        return result
+            except ConnectionException as connect_error:
+                _LOGGER.debug(f"Async Get Data connect_error: {connect_error}")
+                # drop the connection so the next poll reconnects from scratch
+                self.close()
+                self.backoff()
+                raise ConnectionError() from connect_error
+            except ModbusException as modbus_error:
+                _LOGGER.debug(f"Async Get Data modbus_error: {modbus_error}")
+                self.close()
+                self.backoff()
+                raise ModbusError() from modbus_error
+            except Exception as exception_error:
+                _LOGGER.debug(f"Async Get Data generic error: {exception_error}")
+                self.close()
+                self.backoff()
+                raise ExceptionError() from exception_error
 
-    def find_sunspec_modbus_m160_offset(self) -> int:
+    async def find_sunspec_modbus_m160_offset(self) -> int:
         """Find SunSpec Model 160 Offset.
 
         This function attempts to find the offset for SunSpec Model 160 by trying different offsets.
@@ -292,7 +419,7 @@ class ABBPowerOneFimerAPI:
                 _LOGGER.debug(
                     f"(find_m160) Find M160 for model: {invmodel} at offset: {offset}"
                 )
-                read_model_160_data = self.read_holding_registers(
+                read_model_160_data = await self.read_holding_registers(
                     address=(self._base_addr + offset), count=1
                 )
                 if isinstance(read_model_160_data, ExceptionResponse):
@@ -301,10 +428,7 @@ class ABBPowerOneFimerAPI:
                         f"(find_m160) Received Modbus library exception: {read_model_160_data}"
                     )
                 else:
-                    decoder = BinaryPayloadDecoder.fromRegisters(
-                        read_model_160_data.registers, byteorder=Endian.BIG
-                    )
-                    multi_mppt_id = decoder.decode_16bit_uint()
+                    multi_mppt_id = read_model_160_data.registers[0]
                 if multi_mppt_id != SUNSPEC_MODEL_160_ID:
                     _LOGGER.debug(
                         f"(find_m160) Model is not 160 - offset: {offset} - multi_mppt_id: {multi_mppt_id}"
@@ -332,7 +456,7 @@ class ABBPowerOneFimerAPI:
             raise ExceptionError() from exception_error
         return found_offset
 
-    def read_sunspec_modbus_model_1(self):
+    async def read_sunspec_modbus_model_1(self):
         """Read SunSpec Model 1 Data."""
         # A single register is 2 bytes. Max number of registers in one read for Modbus/TCP is 123
         # https://control.com/forums/threads/maximum-amount-of-holding-registers-per-request.9904/post-86251
@@ -342,7 +466,7 @@ class ABBPowerOneFimerAPI:
         # Start address 4 read 64 registers to read M1 (Common Inverter Info) in 1-pass
         # Start address 72 read 92 registers to read (M101 or M103)+M160 (Realtime Power/Energy Data) in 1-pass
         try:
-            read_model_1_data = self.read_holding_registers(
+            read_model_1_data = await self.read_holding_registers(
                 address=(self._base_addr + 4), count=64
             )
             if isinstance(read_model_1_data, ExceptionResponse):
@@ -364,14 +488,20 @@ class ABBPowerOneFimerAPI:
             raise ExceptionError() from exception_error
 
         # No connection errors, we can start scraping registers
-        decoder = BinaryPayloadDecoder.fromRegisters(
-            read_model_1_data.registers, byteorder=Endian.BIG
+        (
+            comm_manufact,
+            comm_model,
+            comm_options,
+            comm_version,
+            comm_sernum,
+        ) = _M1_STRINGS_LAYOUT.unpack_from(
+            _registers_to_bytes(read_model_1_data.registers)
         )
 
         # registers 4 to 43
-        comm_manufact = str.strip(decoder.decode_string(size=32).decode("ascii"))
-        comm_model = str.strip(decoder.decode_string(size=32).decode("ascii"))
-        comm_options = str.strip(decoder.decode_string(size=16).decode("ascii"))
+        comm_manufact = str.strip(comm_manufact.decode("ascii"))
+        comm_model = str.strip(comm_model.decode("ascii"))
+        comm_options = str.strip(comm_options.decode("ascii"))
         self.data["comm_manufact"] = comm_manufact.rstrip(" \t\r\n\0\u0000")
         self.data["comm_model"] = comm_model.rstrip(" \t\r\n\0\u0000")
         self.data["comm_options"] = comm_options.rstrip(" \t\r\n\0\u0000")
@@ -406,8 +536,8 @@ class ABBPowerOneFimerAPI:
             )
 
         # registers 44 to 67
-        comm_version = str.strip(decoder.decode_string(size=16).decode("ascii"))
-        comm_sernum = str.strip(decoder.decode_string(size=32).decode("ascii"))
+        comm_version = str.strip(comm_version.decode("ascii"))
+        comm_sernum = str.strip(comm_sernum.decode("ascii"))
         self.data["comm_version"] = comm_version.rstrip(" \t\r\n\0\u0000")
         self.data["comm_sernum"] = comm_sernum.rstrip(" \t\r\n\0\u0000")
         _LOGGER.debug(f"(read_rt_1) Version: {self.data['comm_version']}")
@@ -415,7 +545,7 @@ class ABBPowerOneFimerAPI:
 
         return True
 
-    def read_sunspec_modbus_model_101_103(self):
+    async def read_sunspec_modbus_model_101_103(self):
         """Read SunSpec Model 101/103 Data."""
 
         # Max number of registers in one read for Modbus/TCP is 123
@@ -427,7 +557,7 @@ class ABBPowerOneFimerAPI:
         #   - Sweep 2 (M103): Start address 70 read 40 registers to read M103+M160 (Realtime Power/Energy Data)
         #   - Sweep 3 (M160): Start address 124 read 40 registers to read M1 (Common Inverter Info)
         try:
-            read_model_101_103_data = self.read_holding_registers(
+            read_model_101_103_data = await self.read_holding_registers(
                 address=(self._base_addr + 70), count=40
             )
             if isinstance(read_model_101_103_data, ExceptionResponse):
@@ -443,9 +573,6 @@ class ABBPowerOneFimerAPI:
                 f"(read_rt_101_103) Read M101/M103 modbus_error: {modbus_error}"
             )
             raise ModbusError() from modbus_error
-        except ModbusException as modbus_error:
-            _LOGGER.debug(f"(read_rt_101_103) Find M160 modbus_error: {modbus_error}")
-            raise ModbusError() from modbus_error
         except ConnectionException as connect_error:
             _LOGGER.debug(
                 f"(read_rt_101_103) Connection connect_error: {connect_error}"
@@ -456,102 +583,43 @@ class ABBPowerOneFimerAPI:
             raise ExceptionError() from exception_error
 
         # No connection errors, we can start scraping registers
-        decoder = BinaryPayloadDecoder.fromRegisters(
-            read_model_101_103_data.registers, byteorder=Endian.BIG
-        )
+        regs = read_model_101_103_data.registers
+        _M101_103_LAYOUT.pack_into(self._m101_103_buf, 0, *regs)
+        sregs = _M101_103_SIGNED_LAYOUT.unpack_from(self._m101_103_buf)
 
         # register 70
-        invtype = decoder.decode_16bit_uint()
+        invtype = regs[0]
         _LOGGER.debug(f"(read_rt_101_103) Inverter Type (int): {invtype}")
-        _LOGGER.debug(
-            f"(read_rt_101_103) Inverter Type (str): {INVERTER_TYPE[invtype]}"
-        )
 
         # make sure the value is in the known status list
         if invtype not in INVERTER_TYPE:
             invtype = 999
             _LOGGER.debug(f"(read_rt_101_103) Inverter Type Unknown (int): {invtype}")
-            _LOGGER.debug(
-                f"(read_rt_101_103) Inverter Type Unknown (str): {INVERTER_TYPE[invtype]}"
-            )
+        _LOGGER.debug(
+            f"(read_rt_101_103) Inverter Type (str): {INVERTER_TYPE[invtype]}"
+        )
         self.data["invtype"] = INVERTER_TYPE[invtype]
 
-        # skip register 71
-        decoder.skip_bytes(2)
-
-        # registers 72 to 76
-        accurrent = decoder.decode_16bit_uint()
-
-        if invtype == 103:
-            accurrenta = decoder.decode_16bit_uint()
-            accurrentb = decoder.decode_16bit_uint()
-            accurrentc = decoder.decode_16bit_uint()
-        else:
-            decoder.skip_bytes(6)
-
-        accurrentsf = decoder.decode_16bit_int()
-        accurrent = self.calculate_value(accurrent, accurrentsf)
-        self.data["accurrent"] = round(accurrent, abs(accurrentsf))
-
-        if invtype == 103:
-            accurrenta = self.calculate_value(accurrenta, accurrentsf)
-            accurrentb = self.calculate_value(accurrentb, accurrentsf)
-            accurrentc = self.calculate_value(accurrentc, accurrentsf)
-            self.data["accurrenta"] = round(accurrenta, abs(accurrentsf))
-            self.data["accurrentb"] = round(accurrentb, abs(accurrentsf))
-            self.data["accurrentc"] = round(accurrentc, abs(accurrentsf))
-
-        # registers 77 to 83
-        if invtype == 103:
-            acvoltageab = decoder.decode_16bit_uint()
-            acvoltagebc = decoder.decode_16bit_uint()
-            acvoltageca = decoder.decode_16bit_uint()
-        else:
-            decoder.skip_bytes(6)
-
-        acvoltagean = decoder.decode_16bit_uint()
-
-        if invtype == 103:
-            acvoltagebn = decoder.decode_16bit_uint()
-            acvoltagecn = decoder.decode_16bit_uint()
-        else:
-            decoder.skip_bytes(4)
-
-        acvoltagesf = decoder.decode_16bit_int()
-
-        acvoltagean = self.calculate_value(acvoltagean, acvoltagesf)
-        self.data["acvoltagean"] = round(acvoltagean, abs(acvoltagesf))
-
-        if invtype == 103:
-            acvoltageab = self.calculate_value(acvoltageab, acvoltagesf)
-            acvoltagebc = self.calculate_value(acvoltagebc, acvoltagesf)
-            acvoltageca = self.calculate_value(acvoltageca, acvoltagesf)
-            acvoltagebn = self.calculate_value(acvoltagebn, acvoltagesf)
-            acvoltagecn = self.calculate_value(acvoltagecn, acvoltagesf)
-            self.data["acvoltageab"] = round(acvoltageab, abs(acvoltagesf))
-            self.data["acvoltagebc"] = round(acvoltagebc, abs(acvoltagesf))
-            self.data["acvoltageca"] = round(acvoltageca, abs(acvoltagesf))
-            self.data["acvoltagebn"] = round(acvoltagebn, abs(acvoltagesf))
-            self.data["acvoltagecn"] = round(acvoltagecn, abs(acvoltagesf))
-
-        # registers 84 to 85
-        acpower = decoder.decode_16bit_int()
-        acpowersf = decoder.decode_16bit_int()
-        acpower = self.calculate_value(acpower, acpowersf)
-        self.data["acpower"] = round(acpower, abs(acpowersf))
-
-        # registers 86 to 87
-        acfreq = decoder.decode_16bit_uint()
-        acfreqsf = decoder.decode_16bit_int()
-        acfreq = self.calculate_value(acfreq, acfreqsf)
-        self.data["acfreq"] = round(acfreq, abs(acfreqsf))
-
-        # skip register 88-93
-        decoder.skip_bytes(12)
+        # registers 72 to 87 and 97 to 102 (register 71 and 88-93 are skipped)
+        scaled_regs = SUNSPEC_M101_103_REGS
+        if invtype == 101:
+            scaled_regs += SUNSPEC_M101_REGS
+        elif invtype == 103:
+            scaled_regs += SUNSPEC_M103_REGS
+        self.scale_registers(regs, sregs, scaled_regs)
+        if invtype == 101:
+            _LOGGER.debug(
+                f"(read_rt_101_103) DC Current Value read: {self.data['dccurr']}"
+            )
+            _LOGGER.debug(
+                f"(read_rt_101_103) DC Voltage Value read: {self.data['dcvolt']}"
+            )
+        _LOGGER.debug(f"(read_rt_101_103) DC Power Value read: {self.data['dcpower']}")
 
         # registers 94 to 96
-        totalenergy = decoder.decode_32bit_uint()
-        totalenergysf = decoder.decode_16bit_uint()
+        totalenergy = (regs[24] << 16) | regs[25]
+        # WH_SF is a signed sunssf like every other SunSpec scale factor
+        totalenergysf = sregs[26]
         totalenergy = self.calculate_value(totalenergy, totalenergysf)
         # ensure that totalenergy is always an increasing value (total_increasing)
         _LOGGER.debug(f"(read_rt_101_103) Total Energy Value Read: {totalenergy}")
@@ -565,50 +633,23 @@ class ABBPowerOneFimerAPI:
         else:
             self.data["totalenergy"] = totalenergy
 
-        # registers 97 to 100 (for monophase inverters)
-        if invtype == 101:
-            dccurr = decoder.decode_16bit_int()
-            dccurrsf = decoder.decode_16bit_int()
-            dcvolt = decoder.decode_16bit_int()
-            dcvoltsf = decoder.decode_16bit_int()
-            dccurr = self.calculate_value(dccurr, dccurrsf)
-            dcvolt = self.calculate_value(dcvolt, dcvoltsf)
-            self.data["dccurr"] = round(dccurr, abs(dccurrsf))
-            self.data["dcvolt"] = round(dcvolt, abs(dcvoltsf))
-            _LOGGER.debug(
-                f"(read_rt_101_103) DC Current Value read: {self.data['dccurr']}"
-            )
-            _LOGGER.debug(
-                f"(read_rt_101_103) DC Voltage Value read: {self.data['dcvolt']}"
-            )
-        else:
-            decoder.skip_bytes(8)
-
-        # registers 101 to 102
-        dcpower = decoder.decode_16bit_int()
-        dcpowersf = decoder.decode_16bit_int()
-        dcpower = self.calculate_value(dcpower, dcpowersf)
-        self.data["dcpower"] = round(dcpower, abs(dcpowersf))
-        _LOGGER.debug(f"(read_rt_101_103) DC Power Value read: {self.data['dcpower']}")
-        # register 103
-        tempcab = decoder.decode_16bit_int()
-        # skip registers 104-105
-        decoder.skip_bytes(4)
-        # register 106 to 107
-        tempoth = decoder.decode_16bit_int()
-        tempsf = decoder.decode_16bit_int()
+        # register 103 (104-105 skipped) and registers 106 to 107
+        tempcab = sregs[33]
+        tempoth = sregs[36]
+        tempsf = sregs[37]
         # Fix for tempcab: in some inverters SF must be -2 not -1 as per specs
         tempcab_fix = tempcab
         tempcab = self.calculate_value(tempcab, tempsf)
         if tempcab > 50:
             tempcab = self.calculate_value(tempcab_fix, -2)
         tempoth = self.calculate_value(tempoth, tempsf)
+        # abs(): tempcab may be scaled by the -2 fix rather than tempsf
         self.data["tempoth"] = round(tempoth, abs(tempsf))
         self.data["tempcab"] = round(tempcab, abs(tempsf))
         _LOGGER.debug(f"(read_rt_101_103) Temp Oth Value read: {self.data['tempoth']}")
         _LOGGER.debug(f"(read_rt_101_103) Temp Cab Value read: {self.data['tempcab']}")
         # register 108
-        status = decoder.decode_16bit_int()
+        status = sregs[38]
         # make sure the value is in the known status list
         if status not in DEVICE_STATUS:
             _LOGGER.debug(f"Unknown Operating State: {status}")
@@ -619,7 +660,7 @@ class ABBPowerOneFimerAPI:
         )
 
         # register 109
-        statusvendor = decoder.decode_16bit_int()
+        statusvendor = sregs[39]
         # make sure the value is in the known status list
         if statusvendor not in DEVICE_GLOBAL_STATUS:
             _LOGGER.debug(
@@ -633,7 +674,7 @@ class ABBPowerOneFimerAPI:
         _LOGGER.debug("(read_rt_101_103) Completed")
         return True
 
-    def read_sunspec_modbus_model_160(self, offset=122):
+    async def read_sunspec_modbus_model_160(self, offset=122):
         """Read SunSpec Model 160 Data."""
         # Max number of registers in one read for Modbus/TCP is 123
         # https://control.com/forums/threads/maximum-amount-of-holding-registers-per-request.9904/post-86251
@@ -651,7 +692,7 @@ class ABBPowerOneFimerAPI:
             _LOGGER.debug(f"(read_rt_160) Slave ID: {self._slave_id}")
             _LOGGER.debug(f"(read_rt_160) Base Address: {self._base_addr}")
             _LOGGER.debug(f"(read_rt_160) Offset: {offset}")
-            read_model_160_data = self.read_holding_registers(
+            read_model_160_data = await self.read_holding_registers(
                 address=(self._base_addr + offset), count=42
             )
             if isinstance(read_model_160_data, ExceptionResponse):
@@ -671,69 +712,31 @@ class ABBPowerOneFimerAPI:
             raise ExceptionError() from exception_error
 
         # No connection errors, we can start scraping registers
-        decoder = BinaryPayloadDecoder.fromRegisters(
-            read_model_160_data.registers, byteorder=Endian.BIG
-        )
-
-        # skip registers 122-123
-        decoder.skip_bytes(4)
-
-        # registers 124 to 126
-        dcasf = decoder.decode_16bit_int()
-        dcvsf = decoder.decode_16bit_int()
-        dcwsf = decoder.decode_16bit_int()
-
-        # skip register 127 to 129
-        decoder.skip_bytes(6)
+        regs = read_model_160_data.registers
+        _M160_LAYOUT.pack_into(self._m160_buf, 0, *regs)
+        sregs = _M160_SIGNED_LAYOUT.unpack_from(self._m160_buf)
 
         # register 130 (# of DC modules)
-        multi_mppt_nr = decoder.decode_16bit_int()
+        multi_mppt_nr = sregs[8]
         self.data["mppt_nr"] = multi_mppt_nr
         _LOGGER.debug(f"(read_rt_160) mppt_nr {multi_mppt_nr}")
 
-        # if we have at least one DC module
+        # registers 141 to 143 if we have at least one DC module
+        # registers 161 to 163 if we have more than one DC module
         if multi_mppt_nr >= 1:
-            # skip register 131 to 140
-            decoder.skip_bytes(20)
-
-            # registers 141 to 143
-            dc1curr = decoder.decode_16bit_uint()
-            dc1volt = decoder.decode_16bit_uint()
-            dc1power = decoder.decode_16bit_uint()
-            dc1curr = self.calculate_value(dc1curr, dcasf)
-            self.data["dc1curr"] = round(dc1curr, abs(dcasf))
-            dc1volt = self.calculate_value(dc1volt, dcvsf)
-            self.data["dc1volt"] = round(dc1volt, abs(dcvsf))
+            scaled_regs = SUNSPEC_M160_MODULE_1_REGS
+            if multi_mppt_nr > 1:
+                scaled_regs += SUNSPEC_M160_MODULE_2_REGS
+            self.scale_registers(regs, sregs, scaled_regs)
             # this fixes dcvolt -0.0 for UNO-DM/REACT2 models
-            self.data["dcvolt"] = round(dc1volt, abs(dcvsf))
-            dc1power = self.calculate_value(dc1power, dcwsf)
-            self.data["dc1power"] = round(dc1power, abs(dcwsf))
-            _LOGGER.debug(
-                f"(read_rt_160) dc1curr: {dc1curr} Round: {self.data['dc1curr']} SF: {dcasf}"
-            )
-            _LOGGER.debug(f"(read_rt_160) dc1volt {self.data['dc1volt']}")
-            _LOGGER.debug(f"(read_rt_160) dc1power {self.data['dc1power']}")
-
-        # if we have more than one DC module
-        if multi_mppt_nr > 1:
-            # skip register 144 to 160
-            decoder.skip_bytes(34)
-
-            # registers 161 to 163
-            dc2curr = decoder.decode_16bit_uint()
-            dc2volt = decoder.decode_16bit_uint()
-            dc2power = decoder.decode_16bit_uint()
-            dc2curr = self.calculate_value(dc2curr, dcasf)
-            self.data["dc2curr"] = round(dc2curr, abs(dcasf))
-            dc2volt = self.calculate_value(dc2volt, dcvsf)
-            self.data["dc2volt"] = round(dc2volt, abs(dcvsf))
-            dc2power = self.calculate_value(dc2power, dcwsf)
-            self.data["dc2power"] = round(dc2power, abs(dcwsf))
+            self.data["dcvolt"] = self.data["dc1volt"]
             _LOGGER.debug(
-                f"(read_rt_160) dc2curr: {dc2curr} Round: {self.data['dc2curr']} SF: {dcasf}"
+                f"(read_rt_160) dc1curr {self.data['dc1curr']} dc1volt {self.data['dc1volt']} dc1power {self.data['dc1power']}"
             )
-            _LOGGER.debug(f"(read_rt_160) dc2volt {self.data['dc2volt']}")
-            _LOGGER.debug(f"(read_rt_160) dc2power {self.data['dc2power']}")
+            if multi_mppt_nr > 1:
+                _LOGGER.debug(
+                    f"(read_rt_160) dc2curr {self.data['dc2curr']} dc2volt {self.data['dc2volt']} dc2power {self.data['dc2power']}"
+                )
 
         _LOGGER.debug("(read_rt_160) Completed")
         return True
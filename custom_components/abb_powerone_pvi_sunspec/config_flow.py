@@ -38,6 +38,53 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Validators shared by the config and options flows, built once at import
+PORT_VALIDATOR = vol.All(vol.Coerce(int), vol.Clamp(min=0, max=65535))
+BASE_ADDR_VALIDATOR = vol.All(vol.Coerce(int), vol.Clamp(min=0, max=65535))
+SCAN_INTERVAL_VALIDATOR = vol.All(vol.Coerce(int), vol.Clamp(min=30, max=600))
+# the number selector returns a float, store the slave id as an int
+SLAVE_ID_SELECTOR = vol.All(
+    selector(
+        {
+            "number": {
+                "min": 1,
+                "max": 247,
+                "step": 1,
+                "mode": "box",
+            }
+        }
+    ),
+    vol.Coerce(int),
+)
+
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(
+            CONF_NAME,
+            default=DEFAULT_NAME,
+        ): cv.string,
+        vol.Required(
+            CONF_HOST,
+        ): cv.string,
+        vol.Required(
+            CONF_PORT,
+            default=DEFAULT_PORT,
+        ): PORT_VALIDATOR,
+        vol.Required(
+            CONF_SLAVE_ID,
+            default=DEFAULT_SLAVE_ID,
+        ): SLAVE_ID_SELECTOR,
+        vol.Required(
+            CONF_BASE_ADDR,
+            default=DEFAULT_BASE_ADDR,
+        ): BASE_ADDR_VALIDATOR,
+        vol.Required(
+            CONF_SCAN_INTERVAL,
+            default=DEFAULT_SCAN_INTERVAL,
+        ): SCAN_INTERVAL_VALIDATOR,
+    },
+)
+
 
 def host_valid(host):
     """Return True if hostname or IP address is valid."""
@@ -107,11 +154,11 @@ class ABBPowerOneFimerConfigFlow(ConfigFlow, domain=DOMAIN):
                 self._base_addr,
                 self._scan_interval,
             )
-            _LOGGER.debug("API Client created: calling get data")
-            self.api_data = await self.api.async_get_data()
-            _LOGGER.debug("API Client: get data")
-            _LOGGER.debug(f"API Client Data: {self.api_data}")
-            return self.api.data["comm_sernum"]
+            _LOGGER.debug("API Client created: calling get sernum")
+            # only the serial number is needed here, skip the realtime sweeps
+            sernum = await self.api.async_get_sernum()
+            _LOGGER.debug(f"API Client Sernum: {sernum}")
+            return sernum
         except ConnectionException as connerr:
             _LOGGER.error(
                 f"Failed to connect to host: {self._host}:{self._port} - slave id: {self._slave_id} - Exception: {connerr}"
@@ -123,12 +170,13 @@ class ABBPowerOneFimerConfigFlow(ConfigFlow, domain=DOMAIN):
         errors = {}
 
         if user_input is not None:
-            name = str(user_input[CONF_NAME])
-            host = str(user_input[CONF_HOST])
-            port = int(user_input[CONF_PORT])
-            slave_id = int(user_input[CONF_SLAVE_ID])
-            base_addr = int(user_input[CONF_BASE_ADDR])
-            scan_interval = int(user_input[CONF_SCAN_INTERVAL])
+            # already coerced to str/int by STEP_USER_DATA_SCHEMA
+            name = user_input[CONF_NAME]
+            host = user_input[CONF_HOST]
+            port = user_input[CONF_PORT]
+            slave_id = user_input[CONF_SLAVE_ID]
+            base_addr = user_input[CONF_BASE_ADDR]
+            scan_interval = user_input[CONF_SCAN_INTERVAL]
 
             if self._host_in_configuration_exists(host):
                 errors[CONF_HOST] = "Device Already Configured"
@@ -156,42 +204,7 @@ class ABBPowerOneFimerConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_NAME,
-                        default=DEFAULT_NAME,
-                    ): cv.string,
-                    vol.Required(
-                        CONF_HOST,
-                    ): cv.string,
-                    vol.Required(
-                        CONF_PORT,
-                        default=DEFAULT_PORT,
-                    ): vol.All(vol.Coerce(int), vol.Clamp(min=0, max=65535)),
-                    vol.Required(
-                        CONF_SLAVE_ID,
-                        default=DEFAULT_SLAVE_ID,
-                    ): selector(
-                        {
-                            "number": {
-                                "min": 1,
-                                "max": 247,
-                                "step": 1,
-                                "mode": "box",
-                            }
-                        }
-                    ),
-                    vol.Required(
-                        CONF_BASE_ADDR,
-                        default=DEFAULT_BASE_ADDR,
-                    ): vol.All(vol.Coerce(int), vol.Clamp(min=0, max=65535)),
-                    vol.Required(
-                        CONF_SCAN_INTERVAL,
-                        default=DEFAULT_SCAN_INTERVAL,
-                    ): vol.All(vol.Coerce(int), vol.Clamp(min=30, max=600)),
-                },
-            ),
+            data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
 
@@ -212,28 +225,19 @@ class ABBPowerOneFimerOptionsFlow(OptionsFlow):
                 vol.Required(
                     CONF_PORT,
                     default=config_entry.data.get(CONF_PORT),
-                ): vol.All(vol.Coerce(int), vol.Clamp(min=0, max=65535)),
+                ): PORT_VALIDATOR,
                 vol.Required(
                     CONF_SLAVE_ID,
                     default=config_entry.data.get(CONF_SLAVE_ID),
-                ): selector(
-                    {
-                        "number": {
-                            "min": 1,
-                            "max": 247,
-                            "step": 1,
-                            "mode": "box",
-                        }
-                    }
-                ),
+                ): SLAVE_ID_SELECTOR,
                 vol.Required(
                     CONF_BASE_ADDR,
                     default=config_entry.data.get(CONF_BASE_ADDR),
-                ): vol.All(vol.Coerce(int), vol.Clamp(min=0, max=65535)),
+                ): BASE_ADDR_VALIDATOR,
                 vol.Required(
                     CONF_SCAN_INTERVAL,
                     default=config_entry.data.get(CONF_SCAN_INTERVAL),
-                ): vol.All(vol.Coerce(int), vol.Clamp(min=30, max=600)),
+                ): SCAN_INTERVAL_VALIDATOR,
             }
         )
 
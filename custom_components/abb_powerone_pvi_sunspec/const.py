@@ -39,8 +39,50 @@ DEFAULT_SLAVE_ID = 2
 DEFAULT_BASE_ADDR = 0
 DEFAULT_SCAN_INTERVAL = 60
 MIN_SCAN_INTERVAL = 30
+MAX_RETRY_BACKOFF = 300
+TCP_KEEPALIVE_IDLE = 30
+TCP_KEEPALIVE_INTERVAL = 10
+TCP_KEEPALIVE_COUNT = 3
 SUNSPEC_M160_OFFSETS = [122, 1104, 208]
 SUNSPEC_MODEL_160_ID = 160
+
+# SunSpec M101/M103 scaled values: (data key, value offset, signed, sf offset)
+# Offsets are relative to the M101/M103 sweep start (base address + 70)
+SUNSPEC_M101_103_REGS = (
+    ("accurrent", 2, False, 6),
+    ("acvoltagean", 10, False, 13),
+    ("acpower", 14, True, 15),
+    ("acfreq", 16, False, 17),
+    ("dcpower", 31, True, 32),
+)
+# Registers only populated by single phase inverters (M101)
+SUNSPEC_M101_REGS = (
+    ("dccurr", 27, True, 28),
+    ("dcvolt", 29, True, 30),
+)
+# Registers only populated by three phase inverters (M103)
+SUNSPEC_M103_REGS = (
+    ("accurrenta", 3, False, 6),
+    ("accurrentb", 4, False, 6),
+    ("accurrentc", 5, False, 6),
+    ("acvoltageab", 7, False, 13),
+    ("acvoltagebc", 8, False, 13),
+    ("acvoltageca", 9, False, 13),
+    ("acvoltagebn", 11, False, 13),
+    ("acvoltagecn", 12, False, 13),
+)
+# SunSpec M160 DC module values, offsets relative to the M160 sweep start
+SUNSPEC_M160_MODULE_1_REGS = (
+    ("dc1curr", 19, False, 2),
+    ("dc1volt", 20, False, 3),
+    ("dc1power", 21, False, 4),
+)
+SUNSPEC_M160_MODULE_2_REGS = (
+    ("dc2curr", 39, False, 2),
+    ("dc2volt", 40, False, 3),
+    ("dc2power", 41, False, 4),
+)
+
 STARTUP_MESSAGE = f"""
 -------------------------------------------------------------------
 {NAME}
@@ -59,6 +59,7 @@ class ABBPowerOneFimerCoordinator(DataUpdateCoordinator):
             name=f"{DOMAIN} ({config_entry.unique_id})",
             update_method=self.async_update_data,
             update_interval=self.update_interval,
+            always_update=False,
         )
 
         self.last_update_time = datetime.now()
@@ -88,7 +89,9 @@ class ABBPowerOneFimerCoordinator(DataUpdateCoordinator):
             _LOGGER.debug(
                 f"Data Coordinator: Update completed at {self.last_update_time}"
             )
-            return self.last_update_status
+            # return a snapshot of the data: with always_update=False entities
+            # are notified only when it differs from the previous one
+            return dict(self.api.data)
         except Exception as ex:
             self.last_update_status = False
             _LOGGER.debug(f"Coordinator Update Error: {ex} at {self.last_update_time}")